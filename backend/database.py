@@ -1,10 +1,18 @@
 from sqlalchemy.orm import sessionmaker , declarative_base
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 
 DATABASE_URL="sqlite:///./capstone.db"
 
 engine=create_engine(DATABASE_URL, connect_args={"check_same_thread":False})
 
+# WAL lets readers keep reading while a writer commits, so long reads such as
+# /bootstrap don't make writes fail with "database is locked".
+@event.listens_for(engine, "connect")
+def enable_wal(dbapi_connection, connection_record):
+    cursor=dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
 sessionlocal=sessionmaker(autocommit= False, autoflush= False ,bind=engine)
 
 base=declarative_base()
@@ -1,10 +1,17 @@
 from database import engine, base, sessionlocal
-from models import EmployeeDB, ProjectDB, AllocationDB
+from models import EmployeeDB, ProjectDB, AllocationDB, AllocationHistoryDB, AllocationSnapshotDB, skill_key
 from sqlalchemy.orm import Session 
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import func
+from sqlalchemy import func, or_, case, literal, insert, select, update, inspect, tuple_, false
+from datetime import datetime, timezone
+from typing import Optional
+from functools import lru_cache
+import hashlib
+import os
 
 app = FastAPI(title="Project Resource Allocation System")
 
@@ -16,7 +23,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-base.metadata.create_all(bind=engine)
+app.add_middleware(GZipMiddleware, minimum_size=500)
 
 def get_db():
     db=sessionlocal()
@@ -70,6 +77,31 @@ class AllocationResponse(AllocationBase):
     allocation_id: int 
 
 
+class BulkDeleteRequest(BaseModel):
+    ids: list[int] = Field(..., min_length=1, description="Ids of the records to delete")
+    cascade: bool = Field(False, description="Also delete allocations referencing these records")
+
+
+class BulkDeleteResponse(BaseModel):
+    message: str
+    deleted_ids: list[int]
+    deleted_allocations: int
+
+
+class AllocationHistoryResponse(AllocationResponse):
+    valid_from: datetime
+    valid_to: Optional[datetime] = None
+
+
+class SnapshotResponse(BaseModel):
+    snapshot_id: int
+    taken_at: datetime
+    allocation_count: int
+
+    class Config:
+        from_attributes = True
+
+
 class AllocationDetailResponse(BaseModel):
     allocation_id: int
     employee_id: int
@@ -81,16 +113,316 @@ class AllocationDetailResponse(BaseModel):
     allocation_hours: int
     total_employee_hours: int
     remaining_hours: int
+    skills_match: bool
 
     class Config:
         from_attributes = True
 
 
+class BootstrapResponse(BaseModel):
+    employees: list[EmployeeResponse]
+    projects: list[ProjectResponse]
+    allocations: list[AllocationDetailResponse]
+
+
+class EmployeeCapacityViolation(BaseModel):
+    employee_id: int
+    employee_name: str
+    available_hrs: int
+    allocated_hours: int
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectCapacityViolation(BaseModel):
+    project_id: int
+    project_name: str
+    project_duration: int
+    allocated_hours: int
+
+    class Config:
+        from_attributes = True
+
+
+class SkillMismatch(BaseModel):
+    allocation_id: int
+    employee_id: int
+    employee_name: str
+    employee_skills: str
+    project_id: int
+    project_name: str
+    project_skills_required: str
+
+    class Config:
+        from_attributes = True
+
+
+class AuditResponse(BaseModel):
+    over_capacity_employees: list[EmployeeCapacityViolation]
+    over_capacity_projects: list[ProjectCapacityViolation]
+    skill_mismatches: list[SkillMismatch]
+
+
+BULK_CHUNK_SIZE = 500
+SKILL_PAIR_CHUNK_SIZE = 10000
+
+FRONTEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'frontend'))
+FRONTEND_ASSETS = ('styles.css', 'app.js')
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+
+
+@lru_cache(maxsize=32)
+def file_digest(path, mtime):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def hashed_asset_name(filename):
+    path = os.path.join(FRONTEND_DIR, filename)
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{file_digest(path, os.path.getmtime(path))}{ext}"
+
+
+def utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def history_timestamp(db):
+    # SQLite only takes the write lock at the first write. Take it before
+    # reading the clock, so a writer that commits after us can never stamp an
+    # earlier time and close our interval before it starts.
+    db.execute(update(AllocationHistoryDB).where(false()).values(valid_to=None))
+    return utcnow()
+
+
+def open_history(db, allocation, now):
+    db.add(AllocationHistoryDB(
+        allocation_id=allocation.allocation_id,
+        employee_id=allocation.employee_id,
+        project_id=allocation.project_id,
+        allocation_hours=allocation.allocation_hours,
+        valid_from=now
+    ))
+
+
+def close_history(db, now, *conditions):
+    db.query(AllocationHistoryDB).filter(
+        AllocationHistoryDB.valid_to.is_(None),
+        *conditions
+    ).update({AllocationHistoryDB.valid_to: now}, synchronize_session=False)
+
+
+def take_allocation_snapshot(db):
+    now = history_timestamp(db)
+    close_history(db, now)
+    result = db.execute(insert(AllocationHistoryDB).from_select(
+        ['allocation_id', 'employee_id', 'project_id', 'allocation_hours', 'valid_from'],
+        select(
+            AllocationDB.allocation_id,
+            AllocationDB.employee_id,
+            AllocationDB.project_id,
+            AllocationDB.allocation_hours,
+            literal(now)
+        )
+    ))
+
+    snapshot = AllocationSnapshotDB(taken_at=now, allocation_count=result.rowcount)
+    db.add(snapshot)
+    return snapshot
+
+
+def create_tables():
+    history_exists = inspect(engine).has_table(AllocationHistoryDB.__tablename__)
+    base.metadata.create_all(bind=engine)
+
+    # create_all skips tables that already exist, so indexes added after a
+    # database was created have to be created separately.
+    for index in AllocationDB.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+    # The same goes for columns: add skill_key to older tables and fill it in
+    # for rows written without it.
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        for model, skill_column in ((EmployeeDB, EmployeeDB.skilled_language), (ProjectDB, ProjectDB.project_skill_required)):
+            if 'skill_key' not in {column['name'] for column in inspector.get_columns(model.__tablename__)}:
+                conn.exec_driver_sql(f"ALTER TABLE {model.__tablename__} ADD COLUMN skill_key VARCHAR")
+            skills = conn.execute(select(skill_column).where(model.skill_key.is_(None)).distinct()).scalars().all()
+            for skill in skills:
+                conn.execute(update(model).where(
+                    skill_column == skill,
+                    model.skill_key.is_(None)
+                ).values(skill_key=skill_key(skill)))
+
+    if history_exists:
+        return
+
+    # Databases from before the history table already hold allocations; seed
+    # their history with an initial snapshot so point-in-time reads see them.
+    db = sessionlocal()
+    try:
+        if db.query(AllocationDB).first() is not None:
+            take_allocation_snapshot(db)
+            db.commit()
+    finally:
+        db.close()
+
+
+create_tables()
+
+
+def chunked(ids, size=BULK_CHUNK_SIZE):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def bulk_delete(db, model, id_column, allocation_column, item, label):
+    ids = sorted(set(item.ids))
+
+    found = []
+    for chunk in chunked(ids):
+        found.extend(row[0] for row in db.query(id_column).filter(id_column.in_(chunk)).all())
+    missing = sorted(set(ids) - set(found))
+    if missing:
+        raise HTTPException(status_code=404, detail=f"{label}(s) not found: {missing}")
+
+    if not item.cascade:
+        allocations = 0
+        for chunk in chunked(ids):
+            allocations += db.query(AllocationDB).filter(allocation_column.in_(chunk)).count()
+        if allocations > 0:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot delete {label.lower()}s. They have {allocations} allocation(s). Delete allocations first or use cascade."
+            )
+
+    now = history_timestamp(db)
+    history_column = getattr(AllocationHistoryDB, allocation_column.key)
+    allocations = 0
+    for chunk in chunked(ids):
+        if item.cascade:
+            close_history(db, now, history_column.in_(chunk))
+            allocations += db.query(AllocationDB).filter(allocation_column.in_(chunk)).delete(synchronize_session=False)
+        db.query(model).filter(id_column.in_(chunk)).delete(synchronize_session=False)
+    db.commit()
+
+    return {
+        "message": f"{len(ids)} {label.lower()}(s) and {allocations} allocation(s) deleted successfully",
+        "deleted_ids": ids,
+        "deleted_allocations": allocations
+    }
+
+
+def allocation_totals(db, column):
+    return db.query(
+        column,
+        func.sum(AllocationDB.allocation_hours).label('allocated_hours')
+    ).group_by(column).subquery()
+
+
+def allocation_details(db):
+    employee_totals = allocation_totals(db, AllocationDB.employee_id)
+    allocations = db.query(
+        AllocationDB.allocation_id,
+        AllocationDB.employee_id,
+        EmployeeDB.employee_name,
+        EmployeeDB.skilled_language.label('employee_skills'),
+        AllocationDB.project_id,
+        ProjectDB.project_name,
+        ProjectDB.project_skill_required.label('project_skills_required'),
+        AllocationDB.allocation_hours,
+        employee_totals.c.allocated_hours
+    ).join(
+        EmployeeDB, AllocationDB.employee_id == EmployeeDB.employee_id
+    ).join(
+        ProjectDB, AllocationDB.project_id == ProjectDB.project_id
+    ).join(
+        employee_totals, employee_totals.c.employee_id == AllocationDB.employee_id
+    ).all()
+
+    return [{
+        'allocation_id': alloc.allocation_id,
+        'employee_id': alloc.employee_id,
+        'employee_name': alloc.employee_name,
+        'employee_skills': alloc.employee_skills,
+        'project_id': alloc.project_id,
+        'project_name': alloc.project_name,
+        'project_skills_required': alloc.project_skills_required,
+        'allocation_hours': alloc.allocation_hours,
+        'total_employee_hours': alloc.allocated_hours,
+        'remaining_hours': 100 - alloc.allocated_hours,
+        'skills_match': skills_compatible(alloc.employee_skills, alloc.project_skills_required)
+    } for alloc in allocations]
+
+
+@lru_cache(maxsize=4096)
+def skills_compatible(employee_skill, project_skill):
+    employee_skill = skill_key(employee_skill)
+    project_skill = skill_key(project_skill)
+    return employee_skill in project_skill or project_skill in employee_skill
+
+
+def mismatched_skill_pairs(db):
+    # The rule only depends on the two skill keys, so it is evaluated once per
+    # distinct pair of keys instead of once per allocation.
+    employee_skills = [row[0] for row in db.query(EmployeeDB.skill_key).distinct()]
+    project_skills = [row[0] for row in db.query(ProjectDB.skill_key).distinct()]
+    return [
+        (employee_skill, project_skill)
+        for employee_skill in employee_skills
+        for project_skill in project_skills
+        if not skills_compatible(employee_skill, project_skill)
+    ]
+
+
+def employee_capacity(available_hrs):
+    return case((available_hrs < 100, available_hrs), else_=100)
+
+
+def allocation_conflicts(db, filter_column, filter_value, skill_column, matches):
+    rows = db.query(
+        skill_column,
+        func.sum(AllocationDB.allocation_hours),
+        func.count(AllocationDB.allocation_id)
+    ).select_from(AllocationDB).join(
+        EmployeeDB, AllocationDB.employee_id == EmployeeDB.employee_id
+    ).join(
+        ProjectDB, AllocationDB.project_id == ProjectDB.project_id
+    ).filter(filter_column == filter_value).group_by(skill_column).all()
+
+    allocated = sum(hours for _, hours, _ in rows)
+    mismatches = sum(count for skill, _, count in rows if not matches(skill))
+    return allocated, mismatches
+
+
 @app.get('/')
 def root():
     return f"Welcome to project resource allocation system"
 
 
+@app.get('/app', include_in_schema=False)
+def frontend_redirect():
+    return RedirectResponse(url='/app/')
+
+
+@app.get('/app/', include_in_schema=False)
+def frontend_index():
+    with open(os.path.join(FRONTEND_DIR, 'index.html')) as f:
+        html = f.read()
+    for filename in FRONTEND_ASSETS:
+        html = html.replace(f'"{filename}"', f'"{hashed_asset_name(filename)}"')
+    return HTMLResponse(html, headers={'Cache-Control': 'no-cache'})
+
+
+@app.get('/app/{filename}', include_in_schema=False)
+def frontend_asset(filename: str):
+    for asset in FRONTEND_ASSETS:
+        if filename == hashed_asset_name(asset):
+            return FileResponse(os.path.join(FRONTEND_DIR, asset), headers={'Cache-Control': IMMUTABLE_CACHE})
+    raise HTTPException(status_code=404, detail="File not found")
+
+
 @app.post('/create_employee', response_model=EmployeeResponse, status_code=201)
 def create_employee(item: EmployeeCreate, db: Session = Depends(get_db)):
     try:
@@ -179,8 +511,7 @@ def create_allocation(item: AllocationCreate, db: Session = Depends(get_db)):
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        if not (employee.skilled_language.lower() in project.project_skill_required.lower() or 
-                project.project_skill_required.lower() in employee.skilled_language.lower()):
+        if not skills_compatible(employee.skilled_language, project.project_skill_required):
             raise HTTPException(
                 status_code=400,
                 detail=f"Skill mismatch: Employee has '{employee.skilled_language}' but project requires '{project.project_skill_required}'"
@@ -229,6 +560,8 @@ def create_allocation(item: AllocationCreate, db: Session = Depends(get_db)):
             allocation_hours=item.allocation_hours
         )
         db.add(db_item)
+        db.flush()
+        open_history(db, db_item, history_timestamp(db))
         db.commit()
         db.refresh(db_item)
         return db_item
@@ -250,43 +583,102 @@ def read_allocations(db: Session = Depends(get_db)):
 @app.get('/read_allocations_detailed', response_model=list[AllocationDetailResponse])
 def read_allocations_detailed(db: Session = Depends(get_db)):
     try:
-        allocations = db.query(
-            AllocationDB.allocation_id,
-            AllocationDB.employee_id,
+        return allocation_details(db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve detailed allocations: {str(e)}")
+
+
+@app.get('/bootstrap', response_model=BootstrapResponse)
+def bootstrap(db: Session = Depends(get_db)):
+    try:
+        # pysqlite does not open a transaction for SELECTs; begin one so the
+        # three reads see the same data, and end it as soon as they are done
+        # rather than holding it while the response is serialized. The reads
+        # return plain rows, which the rollback does not expire.
+        db.connection().exec_driver_sql("BEGIN")
+        employees = db.query(
+            EmployeeDB.employee_id,
             EmployeeDB.employee_name,
-            EmployeeDB.skilled_language.label('employee_skills'),
-            AllocationDB.project_id,
+            EmployeeDB.skilled_language,
+            EmployeeDB.available_hrs
+        ).all()
+        projects = db.query(
+            ProjectDB.project_id,
             ProjectDB.project_name,
-            ProjectDB.project_skill_required.label('project_skills_required'),
-            AllocationDB.allocation_hours
+            ProjectDB.project_duration,
+            ProjectDB.project_skill_required
+        ).all()
+        allocations = allocation_details(db)
+        db.rollback()
+
+        return {
+            'employees': employees,
+            'projects': projects,
+            'allocations': allocations
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve bootstrap data: {str(e)}")
+
+
+@app.get('/audit', response_model=AuditResponse)
+def audit(db: Session = Depends(get_db)):
+    try:
+        employee_totals = allocation_totals(db, AllocationDB.employee_id)
+
+        over_capacity_employees = db.query(
+            EmployeeDB.employee_id,
+            EmployeeDB.employee_name,
+            EmployeeDB.available_hrs,
+            employee_totals.c.allocated_hours
         ).join(
-            EmployeeDB, AllocationDB.employee_id == EmployeeDB.employee_id
+            employee_totals, employee_totals.c.employee_id == EmployeeDB.employee_id
+        ).filter(
+            employee_totals.c.allocated_hours > employee_capacity(EmployeeDB.available_hrs)
+        ).all()
+
+        project_totals = allocation_totals(db, AllocationDB.project_id)
+
+        over_capacity_projects = db.query(
+            ProjectDB.project_id,
+            ProjectDB.project_name,
+            ProjectDB.project_duration,
+            project_totals.c.allocated_hours
         ).join(
-            ProjectDB, AllocationDB.project_id == ProjectDB.project_id
+            project_totals, project_totals.c.project_id == ProjectDB.project_id
+        ).filter(
+            project_totals.c.allocated_hours > ProjectDB.project_duration
         ).all()
 
-        result = []
-        for alloc in allocations:
-            total_hours = db.query(AllocationDB).filter(
-                AllocationDB.employee_id == alloc.employee_id
-            ).with_entities(func.sum(AllocationDB.allocation_hours)).scalar() or 0
-
-            result.append({
-                'allocation_id': alloc.allocation_id,
-                'employee_id': alloc.employee_id,
-                'employee_name': alloc.employee_name,
-                'employee_skills': alloc.employee_skills,
-                'project_id': alloc.project_id,
-                'project_name': alloc.project_name,
-                'project_skills_required': alloc.project_skills_required,
-                'allocation_hours': alloc.allocation_hours,
-                'total_employee_hours': total_hours,
-                'remaining_hours': 100 - total_hours
-            })
-
-        return result
+        skill_mismatches = []
+        pairs = mismatched_skill_pairs(db)
+        for chunk in chunked(pairs, SKILL_PAIR_CHUNK_SIZE):
+            skill_mismatches.extend(db.query(
+                AllocationDB.allocation_id,
+                AllocationDB.employee_id,
+                EmployeeDB.employee_name,
+                EmployeeDB.skilled_language.label('employee_skills'),
+                AllocationDB.project_id,
+                ProjectDB.project_name,
+                ProjectDB.project_skill_required.label('project_skills_required')
+            ).select_from(EmployeeDB).join(
+                # "+ 0" keeps SQLite from probing employeedb by primary key per
+                # allocation; it scans employees in order and reads their
+                # allocations from the covering index instead.
+                AllocationDB, AllocationDB.employee_id == EmployeeDB.employee_id + 0
+            ).join(
+                ProjectDB, AllocationDB.project_id == ProjectDB.project_id
+            ).filter(
+                EmployeeDB.skill_key != ProjectDB.skill_key,
+                tuple_(EmployeeDB.skill_key, ProjectDB.skill_key).in_(chunk)
+            ).all())
+
+        return {
+            'over_capacity_employees': over_capacity_employees,
+            'over_capacity_projects': over_capacity_projects,
+            'skill_mismatches': skill_mismatches
+        }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve detailed allocations: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to audit allocations: {str(e)}")
 
 
 @app.put('/update_employee/{employee_id}', response_model=EmployeeResponse)
@@ -303,6 +695,22 @@ def update_employee(employee_id: int, item: EmployeeCreate, db: Session = Depend
             ).first()
             if existing:
                 raise HTTPException(status_code=400, detail=f"Employee with name '{item.employee_name}' already exists")
+
+        if item.available_hrs < employee.available_hrs or item.skilled_language != employee.skilled_language:
+            allocated, mismatches = allocation_conflicts(
+                db, AllocationDB.employee_id, employee_id, ProjectDB.project_skill_required,
+                lambda skill: skills_compatible(item.skilled_language, skill)
+            )
+            if allocated > item.available_hrs:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Cannot reduce available hours to {item.available_hrs}. Employee already has {allocated} hours allocated"
+                )
+            if mismatches > 0:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Skill mismatch: {mismatches} existing allocation(s) require skills other than '{item.skilled_language}'"
+                )
         
         employee.employee_name = item.employee_name
         employee.skilled_language = item.skilled_language
@@ -332,6 +740,22 @@ def update_project(project_id: int, item: ProjectCreate, db: Session = Depends(g
             ).first()
             if existing:
                 raise HTTPException(status_code=400, detail=f"Project with name '{item.project_name}' already exists")
+
+        if item.project_duration < project.project_duration or item.project_skill_required != project.project_skill_required:
+            allocated, mismatches = allocation_conflicts(
+                db, AllocationDB.project_id, project_id, EmployeeDB.skilled_language,
+                lambda skill: skills_compatible(skill, item.project_skill_required)
+            )
+            if allocated > item.project_duration:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Cannot reduce project duration to {item.project_duration}. Project already has {allocated} hours allocated"
+                )
+            if mismatches > 0:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Skill mismatch: {mismatches} allocated employee(s) do not have '{item.project_skill_required}'"
+                )
         
         project.project_name = item.project_name
         project.project_duration = item.project_duration
@@ -362,8 +786,7 @@ def update_allocation(allocation_id: int, item: AllocationCreate, db: Session =
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        if not (employee.skilled_language.lower() in project.project_skill_required.lower() or 
-                project.project_skill_required.lower() in employee.skilled_language.lower()):
+        if not skills_compatible(employee.skilled_language, project.project_skill_required):
             raise HTTPException(
                 status_code=400,
                 detail=f"Skill mismatch: Employee has '{employee.skilled_language}' but project requires '{project.project_skill_required}'"
@@ -409,6 +832,10 @@ def update_allocation(allocation_id: int, item: AllocationCreate, db: Session =
         allocation.employee_id = item.employee_id
         allocation.project_id = item.project_id
         allocation.allocation_hours = item.allocation_hours
+
+        now = history_timestamp(db)
+        close_history(db, now, AllocationHistoryDB.allocation_id == allocation_id)
+        open_history(db, allocation, now)
         
         db.commit()
         db.refresh(allocation)
@@ -475,6 +902,7 @@ def delete_allocation(allocation_id: int, db: Session = Depends(get_db)):
         if not allocation:
             raise HTTPException(status_code=404, detail="Allocation not found")
         
+        close_history(db, history_timestamp(db), AllocationHistoryDB.allocation_id == allocation_id)
         db.delete(allocation)
         db.commit()
         return {"message": "Allocation deleted successfully"}
@@ -483,3 +911,70 @@ def delete_allocation(allocation_id: int, db: Session = Depends(get_db)):
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to delete allocation: {str(e)}")
+
+
+@app.post('/bulk_delete_employees', response_model=BulkDeleteResponse)
+def bulk_delete_employees(item: BulkDeleteRequest, db: Session = Depends(get_db)):
+    try:
+        return bulk_delete(db, EmployeeDB, EmployeeDB.employee_id, AllocationDB.employee_id, item, "Employee")
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to delete employees: {str(e)}")
+
+
+@app.post('/bulk_delete_projects', response_model=BulkDeleteResponse)
+def bulk_delete_projects(item: BulkDeleteRequest, db: Session = Depends(get_db)):
+    try:
+        return bulk_delete(db, ProjectDB, ProjectDB.project_id, AllocationDB.project_id, item, "Project")
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to delete projects: {str(e)}")
+
+
+@app.get('/read_allocations_at', response_model=list[AllocationHistoryResponse])
+def read_allocations_at(
+    at: datetime,
+    employee_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    try:
+        if at.tzinfo is not None:
+            at = at.astimezone(timezone.utc).replace(tzinfo=None)
+
+        # Every snapshot closes and reopens all live intervals, so rows live
+        # at `at` never start before the latest snapshot taken by then.
+        since = db.query(func.max(AllocationSnapshotDB.taken_at)).filter(
+            AllocationSnapshotDB.taken_at <= at
+        ).scalar()
+
+        query = db.query(AllocationHistoryDB).filter(
+            AllocationHistoryDB.valid_from <= at,
+            or_(AllocationHistoryDB.valid_to.is_(None), AllocationHistoryDB.valid_to > at)
+        )
+        if since is not None:
+            query = query.filter(AllocationHistoryDB.valid_from >= since)
+        if employee_id is not None:
+            query = query.filter(AllocationHistoryDB.employee_id == employee_id)
+        if project_id is not None:
+            query = query.filter(AllocationHistoryDB.project_id == project_id)
+
+        return query.order_by(AllocationHistoryDB.allocation_id).all()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve allocation history: {str(e)}")
+
+
+@app.post('/create_allocation_snapshot', response_model=SnapshotResponse, status_code=201)
+def create_allocation_snapshot(db: Session = Depends(get_db)):
+    try:
+        snapshot = take_allocation_snapshot(db)
+        db.commit()
+        db.refresh(snapshot)
+        return snapshot
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create allocation snapshot: {str(e)}")
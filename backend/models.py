@@ -1,6 +1,10 @@
 from database import base ,engine
 
-from sqlalchemy import Column , String , Integer ,ForeignKey
+from sqlalchemy import Column , String , Integer ,ForeignKey ,Index ,DateTime
+from sqlalchemy.orm import validates
+
+def skill_key(skill):
+    return skill.lower() if skill is not None else None
 
 class EmployeeDB(base):
     __tablename__="employeedb"
@@ -8,6 +12,12 @@ class EmployeeDB(base):
     employee_name=Column(String)
     skilled_language=Column(String)
     available_hrs=Column(Integer)
+    skill_key=Column(String)
+
+    @validates("skilled_language")
+    def set_skill_key(self,key,value):
+        self.skill_key=skill_key(value)
+        return value
 
 class ProjectDB(base):
     __tablename__="projectdb"
@@ -15,6 +25,12 @@ class ProjectDB(base):
     project_name=Column(String)
     project_duration=Column(Integer)
     project_skill_required=Column(String)
+    skill_key=Column(String)
+
+    @validates("project_skill_required")
+    def set_skill_key(self,key,value):
+        self.skill_key=skill_key(value)
+        return value
 
 class AllocationDB(base):
     __tablename__="allocationdb"
@@ -22,3 +38,31 @@ class AllocationDB(base):
     project_id=Column(Integer,ForeignKey(ProjectDB.project_id))
     employee_id=Column(Integer,ForeignKey(EmployeeDB.employee_id))
     allocation_hours=Column(Integer,default=0)
+
+    __table_args__=(
+        Index("ix_allocationdb_employee_project_hours","employee_id","project_id","allocation_hours"),
+        Index("ix_allocationdb_project_hours","project_id","allocation_hours"),
+    )
+
+class AllocationHistoryDB(base):
+    __tablename__="allocationhistorydb"
+    history_id=Column(Integer,primary_key=True,autoincrement=True)
+    allocation_id=Column(Integer)
+    project_id=Column(Integer)
+    employee_id=Column(Integer)
+    allocation_hours=Column(Integer)
+    valid_from=Column(DateTime,nullable=False)
+    valid_to=Column(DateTime,nullable=True)
+
+    __table_args__=(
+        Index("ix_allocationhistorydb_allocation_open","allocation_id","valid_to"),
+        Index("ix_allocationhistorydb_employee_from","employee_id","valid_from"),
+        Index("ix_allocationhistorydb_project_from","project_id","valid_from"),
+        Index("ix_allocationhistorydb_from","valid_from"),
+    )
+
+class AllocationSnapshotDB(base):
+    __tablename__="allocationsnapshotdb"
+    snapshot_id=Column(Integer,primary_key=True,autoincrement=True)
+    taken_at=Column(DateTime,nullable=False,index=True)
+    allocation_count=Column(Integer)
@@ -1,4 +1,7 @@
-const API_URL = 'http://localhost:8000';
+// Same-origin when served by the backend under /app.
+const API_URL = window.location.pathname.startsWith('/app') ? '' : 'http://localhost:8000';
+
+let appData = { employees: [], projects: [], allocations: [] };
 
 function openTab(tabName, event) {
     const tabs = document.querySelectorAll('.tab-content');
@@ -19,12 +22,12 @@ function openTab(tabName, event) {
         });
     }
 
-    if (tabName === 'employees') loadEmployees();
-    if (tabName === 'projects') loadProjects();
+    if (tabName === 'employees') renderEmployees(appData.employees);
+    if (tabName === 'projects') renderProjects(appData.projects);
     if (tabName === 'allocations') {
-        loadAllocations();
-        loadEmployeesForDropdown();
-        loadProjectsForDropdown();
+        renderAllocations(appData.allocations);
+        renderEmployeesDropdown(appData.employees);
+        renderProjectsDropdown(appData.projects);
     }
 }
 
@@ -35,159 +38,145 @@ function showMessage(elementId, message, type) {
     setTimeout(() => msgElement.classList.remove('show'), 5000);
 }
 
-async function loadEmployees() {
-    const listElement = document.getElementById('employees-list');
-    listElement.innerHTML = '<div class="loading">Loading...</div>';
+async function loadBootstrap() {
+    ['employees-list', 'projects-list', 'allocations-list'].forEach(id => {
+        document.getElementById(id).innerHTML = '<div class="loading">Loading...</div>';
+    });
 
     try {
-        const response = await fetch(`${API_URL}/read_employees`);
-        const employees = await response.json();
-
-        if (employees.length === 0) {
-            listElement.innerHTML = '<div class="empty-state">No employees found. Add one above!</div>';
-            return;
-        }
-
-        let html = '<table class="data-table"><thead><tr><th>ID</th><th>Name</th><th>Skills</th><th>Available Hours</th><th>Actions</th></tr></thead><tbody>';
-        employees.forEach(emp => {
-            html += `<tr>
-                <td>${emp.employee_id}</td>
-                <td>${emp.employee_name}</td>
-                <td>${emp.skilled_language}</td>
-                <td>${emp.available_hrs}</td>
-                <td>
-                    <div class="action-buttons">
-                        <button class="btn btn-small btn-edit" onclick="editEmployee(${emp.employee_id}, '${emp.employee_name.replace(/'/g, "\\'")}', '${emp.skilled_language.replace(/'/g, "\\'")}', ${emp.available_hrs})">Edit</button>
-                        <button class="btn btn-small btn-delete" onclick="deleteEmployee(${emp.employee_id}, '${emp.employee_name.replace(/'/g, "\\'")}')">Delete</button>
-                    </div>
-                </td>
-            </tr>`;
-        });
-        html += '</tbody></table>';
-        listElement.innerHTML = html;
+        const response = await fetch(`${API_URL}/bootstrap`);
+        if (!response.ok) throw new Error(`Bootstrap failed with status ${response.status}`);
+        const data = await response.json();
+        appData = data;
     } catch (error) {
-        listElement.innerHTML = '<div class="empty-state">Failed to load employees</div>';
+        document.getElementById('employees-list').innerHTML = '<div class="empty-state">Failed to load employees</div>';
+        document.getElementById('projects-list').innerHTML = '<div class="empty-state">Failed to load projects</div>';
+        document.getElementById('allocations-list').innerHTML = '<div class="empty-state">Failed to load allocations</div>';
+        return;
     }
+
+    renderEmployees(appData.employees);
+    renderProjects(appData.projects);
+    renderAllocations(appData.allocations);
+    renderEmployeesDropdown(appData.employees);
+    renderProjectsDropdown(appData.projects);
 }
 
-async function loadProjects() {
-    const listElement = document.getElementById('projects-list');
-    listElement.innerHTML = '<div class="loading">Loading...</div>';
+function renderEmployees(employees) {
+    const listElement = document.getElementById('employees-list');
 
-    try {
-        const response = await fetch(`${API_URL}/read_projects`);
-        const projects = await response.json();
+    if (employees.length === 0) {
+        listElement.innerHTML = '<div class="empty-state">No employees found. Add one above!</div>';
+        return;
+    }
 
-        if (projects.length === 0) {
-            listElement.innerHTML = '<div class="empty-state">No projects found. Add one above!</div>';
-            return;
-        }
+    let html = '<table class="data-table"><thead><tr><th>ID</th><th>Name</th><th>Skills</th><th>Available Hours</th><th>Actions</th></tr></thead><tbody>';
+    employees.forEach(emp => {
+        html += `<tr>
+            <td>${emp.employee_id}</td>
+            <td>${emp.employee_name}</td>
+            <td>${emp.skilled_language}</td>
+            <td>${emp.available_hrs}</td>
+            <td>
+                <div class="action-buttons">
+                    <button class="btn btn-small btn-edit" onclick="editEmployee(${emp.employee_id}, '${emp.employee_name.replace(/'/g, "\\'")}', '${emp.skilled_language.replace(/'/g, "\\'")}', ${emp.available_hrs})">Edit</button>
+                    <button class="btn btn-small btn-delete" onclick="deleteEmployee(${emp.employee_id}, '${emp.employee_name.replace(/'/g, "\\'")}')">Delete</button>
+                </div>
+            </td>
+        </tr>`;
+    });
+    html += '</tbody></table>';
+    listElement.innerHTML = html;
+}
 
-        let html = '<table class="data-table"><thead><tr><th>ID</th><th>Project Name</th><th>Duration (hrs)</th><th>Skills Required</th><th>Actions</th></tr></thead><tbody>';
-        projects.forEach(proj => {
-            html += `<tr>
-                <td>${proj.project_id}</td>
-                <td>${proj.project_name}</td>
-                <td>${proj.project_duration}</td>
-                <td>${proj.project_skill_required}</td>
-                <td>
-                    <div class="action-buttons">
-                        <button class="btn btn-small btn-edit" onclick="editProject(${proj.project_id}, '${proj.project_name.replace(/'/g, "\\'")}', ${proj.project_duration}, '${proj.project_skill_required.replace(/'/g, "\\'")}')">Edit</button>
-                        <button class="btn btn-small btn-delete" onclick="deleteProject(${proj.project_id}, '${proj.project_name.replace(/'/g, "\\'")}')">Delete</button>
-                    </div>
-                </td>
-            </tr>`;
-        });
-        html += '</tbody></table>';
-        listElement.innerHTML = html;
-    } catch (error) {
-        listElement.innerHTML = '<div class="empty-state">Failed to load projects</div>';
+function renderProjects(projects) {
+    const listElement = document.getElementById('projects-list');
+
+    if (projects.length === 0) {
+        listElement.innerHTML = '<div class="empty-state">No projects found. Add one above!</div>';
+        return;
     }
+
+    let html = '<table class="data-table"><thead><tr><th>ID</th><th>Project Name</th><th>Duration (hrs)</th><th>Skills Required</th><th>Actions</th></tr></thead><tbody>';
+    projects.forEach(proj => {
+        html += `<tr>
+            <td>${proj.project_id}</td>
+            <td>${proj.project_name}</td>
+            <td>${proj.project_duration}</td>
+            <td>${proj.project_skill_required}</td>
+            <td>
+                <div class="action-buttons">
+                    <button class="btn btn-small btn-edit" onclick="editProject(${proj.project_id}, '${proj.project_name.replace(/'/g, "\\'")}', ${proj.project_duration}, '${proj.project_skill_required.replace(/'/g, "\\'")}')">Edit</button>
+                    <button class="btn btn-small btn-delete" onclick="deleteProject(${proj.project_id}, '${proj.project_name.replace(/'/g, "\\'")}')">Delete</button>
+                </div>
+            </td>
+        </tr>`;
+    });
+    html += '</tbody></table>';
+    listElement.innerHTML = html;
 }
 
-async function loadEmployeesForDropdown() {
-    try {
-        const response = await fetch(`${API_URL}/read_employees`);
-        const employees = await response.json();
-        const select = document.getElementById('allocation_employee_id');
-        select.innerHTML = '<option value="">Select Employee</option>';
-        employees.forEach(emp => {
-            select.innerHTML += `<option value="${emp.employee_id}">${emp.employee_name} (${emp.skilled_language})</option>`;
-        });
-    } catch (error) {
-        console.error('Failed to load employees for dropdown');
-    }
+function renderEmployeesDropdown(employees) {
+    const select = document.getElementById('allocation_employee_id');
+    select.innerHTML = '<option value="">Select Employee</option>';
+    employees.forEach(emp => {
+        select.innerHTML += `<option value="${emp.employee_id}">${emp.employee_name} (${emp.skilled_language})</option>`;
+    });
 }
 
-async function loadProjectsForDropdown() {
-    try {
-        const response = await fetch(`${API_URL}/read_projects`);
-        const projects = await response.json();
-        const select = document.getElementById('allocation_project_id');
-        select.innerHTML = '<option value="">Select Project</option>';
-        projects.forEach(proj => {
-            select.innerHTML += `<option value="${proj.project_id}">${proj.project_name}</option>`;
-        });
-    } catch (error) {
-        console.error('Failed to load projects for dropdown');
-    }
+function renderProjectsDropdown(projects) {
+    const select = document.getElementById('allocation_project_id');
+    select.innerHTML = '<option value="">Select Project</option>';
+    projects.forEach(proj => {
+        select.innerHTML += `<option value="${proj.project_id}">${proj.project_name}</option>`;
+    });
 }
 
-async function loadAllocations() {
+function renderAllocations(allocations) {
     const listElement = document.getElementById('allocations-list');
-    listElement.innerHTML = '<div class="loading">Loading...</div>';
 
-    try {
-        const response = await fetch(`${API_URL}/read_allocations_detailed`);
-        const allocations = await response.json();
-
-        if (allocations.length === 0) {
-            listElement.innerHTML = '<div class="empty-state">No allocations found. Create one above!</div>';
-            return;
-        }
+    if (allocations.length === 0) {
+        listElement.innerHTML = '<div class="empty-state">No allocations found. Create one above!</div>';
+        return;
+    }
 
-        let html = '<table class="data-table"><thead><tr>';
-        html += '<th>ID</th>';
-        html += '<th>Employee</th>';
-        html += '<th>Employee Skills</th>';
-        html += '<th>Project</th>';
-        html += '<th>Skills Required</th>';
-        html += '<th>Hours Allocated</th>';
-        html += '<th>Total Hours</th>';
-        html += '<th>Remaining Hours</th>';
-        html += '<th>Actions</th>';
-        html += '</tr></thead><tbody>';
+    let html = '<table class="data-table"><thead><tr>';
+    html += '<th>ID</th>';
+    html += '<th>Employee</th>';
+    html += '<th>Employee Skills</th>';
+    html += '<th>Project</th>';
+    html += '<th>Skills Required</th>';
+    html += '<th>Hours Allocated</th>';
+    html += '<th>Total Hours</th>';
+    html += '<th>Remaining Hours</th>';
+    html += '<th>Actions</th>';
+    html += '</tr></thead><tbody>';
+    
+    allocations.forEach(alloc => {
+        const skillsStyle = alloc.skills_match ? 'style="background-color: #e8e8e8;"' : '';
         
-        allocations.forEach(alloc => {
-            const skillsMatch = alloc.employee_skills.toLowerCase().includes(alloc.project_skills_required.toLowerCase()) ||
-                              alloc.project_skills_required.toLowerCase().includes(alloc.employee_skills.toLowerCase());
-            const skillsStyle = skillsMatch ? 'style="background-color: #e8e8e8;"' : '';
-            
-            html += `<tr ${skillsStyle}>
-                <td>${alloc.allocation_id}</td>
-                <td><strong>${alloc.employee_name}</strong></td>
-                <td>${alloc.employee_skills}</td>
-                <td><strong>${alloc.project_name}</strong></td>
-                <td>${alloc.project_skills_required}</td>
-                <td>${alloc.allocation_hours}</td>
-                <td>${alloc.total_employee_hours}</td>
-                <td>${alloc.remaining_hours}</td>
-                <td>
-                    <div class="action-buttons">
-                        <button class="btn btn-small btn-edit" onclick="editAllocation(${alloc.allocation_id}, ${alloc.employee_id}, ${alloc.project_id}, ${alloc.allocation_hours})">Edit</button>
-                        <button class="btn btn-small btn-delete" onclick="deleteAllocation(${alloc.allocation_id})">Delete</button>
-                    </div>
-                </td>
-            </tr>`;
-        });
-        html += '</tbody></table>';
-        listElement.innerHTML = html;
-    } catch (error) {
-        listElement.innerHTML = '<div class="empty-state">Failed to load allocations</div>';
-    }
+        html += `<tr ${skillsStyle}>
+            <td>${alloc.allocation_id}</td>
+            <td><strong>${alloc.employee_name}</strong></td>
+            <td>${alloc.employee_skills}</td>
+            <td><strong>${alloc.project_name}</strong></td>
+            <td>${alloc.project_skills_required}</td>
+            <td>${alloc.allocation_hours}</td>
+            <td>${alloc.total_employee_hours}</td>
+            <td>${alloc.remaining_hours}</td>
+            <td>
+                <div class="action-buttons">
+                    <button class="btn btn-small btn-edit" onclick="editAllocation(${alloc.allocation_id}, ${alloc.employee_id}, ${alloc.project_id}, ${alloc.allocation_hours})">Edit</button>
+                    <button class="btn btn-small btn-delete" onclick="deleteAllocation(${alloc.allocation_id})">Delete</button>
+                </div>
+            </td>
+        </tr>`;
+    });
+    html += '</tbody></table>';
+    listElement.innerHTML = html;
 }
 
-loadEmployees();
+loadBootstrap();
 
 let editingEmployeeId = null;
 function editEmployee(id, name, skills, hours) {
@@ -228,7 +217,7 @@ document.getElementById('employee-form').addEventListener('submit', async (e) =>
             e.target.reset();
             editingEmployeeId = null;
             document.querySelector('#employee-form button[type="submit"]').textContent = 'Add Employee';
-            loadEmployees();
+            loadBootstrap();
         } else {
             const error = await response.json();
             showMessage('employee-message', `Error: ${error.detail}`, 'error');
@@ -248,7 +237,7 @@ async function deleteEmployee(id, name) {
 
         if (response.ok) {
             showMessage('employee-message', 'Employee deleted successfully!', 'success');
-            loadEmployees();
+            loadBootstrap();
         } else {
             const error = await response.json();
             showMessage('employee-message', `Error: ${error.detail}`, 'error');
@@ -297,7 +286,7 @@ document.getElementById('project-form').addEventListener('submit', async (e) =>
             e.target.reset();
             editingProjectId = null;
             document.querySelector('#project-form button[type="submit"]').textContent = 'Add Project';
-            loadProjects();
+            loadBootstrap();
         } else {
             const error = await response.json();
             showMessage('project-message', `Error: ${error.detail}`, 'error');
@@ -317,7 +306,7 @@ async function deleteProject(id, name) {
 
         if (response.ok) {
             showMessage('project-message', 'Project deleted successfully!', 'success');
-            loadProjects();
+            loadBootstrap();
         } else {
             const error = await response.json();
             showMessage('project-message', `Error: ${error.detail}`, 'error');
@@ -366,7 +355,7 @@ document.getElementById('allocation-form').addEventListener('submit', async (e)
             e.target.reset();
             editingAllocationId = null;
             document.querySelector('#allocation-form button[type="submit"]').textContent = 'Create Allocation';
-            loadAllocations();
+            loadBootstrap();
         } else {
             const error = await response.json();
             showMessage('allocation-message', `Error: ${error.detail}`, 'error');
@@ -386,7 +375,7 @@ async function deleteAllocation(id) {
 
         if (response.ok) {
             showMessage('allocation-message', 'Allocation deleted successfully!', 'success');
-            loadAllocations();
+            loadBootstrap();
         } else {
             const error = await response.json();
             showMessage('allocation-message', `Error: ${error.detail}`, 'error');
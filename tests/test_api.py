@@ -5,6 +5,8 @@ from fastapi.testclient import TestClient
 from main import app
 from database import base, engine
 import pytest
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 
 client = TestClient(app)
 
@@ -223,3 +225,375 @@ def test_allocation_exceeds_100_hours():
     response = client.post("/create_allocation", json=allocation2_data)
     assert response.status_code == 400
     assert "exceeds 100 hours" in response.json()["detail"]
+
+def test_bulk_delete_employees_requires_cascade():
+    emp_response = client.post("/create_employee", json={
+        "employee_name": "Grace",
+        "skilled_language": "Python",
+        "available_hrs": 40
+    })
+    emp_id = emp_response.json()["employee_id"]
+    proj_response = client.post("/create_project", json={
+        "project_name": "Data Pipeline",
+        "project_duration": 80,
+        "project_skill_required": "Python"
+    })
+    proj_id = proj_response.json()["project_id"]
+    client.post("/create_allocation", json={
+        "employee_id": emp_id,
+        "project_id": proj_id,
+        "allocation_hours": 20
+    })
+
+    response = client.post("/bulk_delete_employees", json={"ids": [emp_id]})
+    assert response.status_code == 400
+    assert "use cascade" in response.json()["detail"]
+    assert len(client.get("/read_employees").json()) == 1
+
+def test_bulk_delete_employees_cascade():
+    emp_ids = []
+    for name in ["Heidi", "Ivan", "Judy"]:
+        response = client.post("/create_employee", json={
+            "employee_name": name,
+            "skilled_language": "Python",
+            "available_hrs": 50
+        })
+        emp_ids.append(response.json()["employee_id"])
+    proj_response = client.post("/create_project", json={
+        "project_name": "Platform",
+        "project_duration": 100,
+        "project_skill_required": "Python"
+    })
+    proj_id = proj_response.json()["project_id"]
+    for emp_id in emp_ids:
+        client.post("/create_allocation", json={
+            "employee_id": emp_id,
+            "project_id": proj_id,
+            "allocation_hours": 10
+        })
+
+    response = client.post("/bulk_delete_employees", json={"ids": emp_ids[:2], "cascade": True})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["deleted_ids"] == sorted(emp_ids[:2])
+    assert data["deleted_allocations"] == 2
+
+    employees = client.get("/read_employees").json()
+    assert [emp["employee_id"] for emp in employees] == [emp_ids[2]]
+    assert len(client.get("/read_allocations").json()) == 1
+
+def test_bulk_delete_projects_missing_id():
+    proj_response = client.post("/create_project", json={
+        "project_name": "Legacy",
+        "project_duration": 30,
+        "project_skill_required": "COBOL"
+    })
+    proj_id = proj_response.json()["project_id"]
+
+    response = client.post("/bulk_delete_projects", json={"ids": [proj_id, 9999]})
+    assert response.status_code == 404
+    assert "9999" in response.json()["detail"]
+    assert len(client.get("/read_projects").json()) == 1
+
+def create_allocated_pair():
+    emp_response = client.post("/create_employee", json={
+        "employee_name": "Karl",
+        "skilled_language": "Python",
+        "available_hrs": 60
+    })
+    emp_id = emp_response.json()["employee_id"]
+    proj_response = client.post("/create_project", json={
+        "project_name": "Analytics",
+        "project_duration": 80,
+        "project_skill_required": "Python"
+    })
+    proj_id = proj_response.json()["project_id"]
+    client.post("/create_allocation", json={
+        "employee_id": emp_id,
+        "project_id": proj_id,
+        "allocation_hours": 40
+    })
+    return emp_id, proj_id
+
+def test_update_employee_below_allocated_hours():
+    emp_id, _ = create_allocated_pair()
+    response = client.put(f"/update_employee/{emp_id}", json={
+        "employee_name": "Karl",
+        "skilled_language": "Python",
+        "available_hrs": 30
+    })
+    assert response.status_code == 400
+    assert "40 hours allocated" in response.json()["detail"]
+
+def test_update_employee_skill_mismatch():
+    emp_id, _ = create_allocated_pair()
+    response = client.put(f"/update_employee/{emp_id}", json={
+        "employee_name": "Karl",
+        "skilled_language": "Java",
+        "available_hrs": 60
+    })
+    assert response.status_code == 400
+    assert "Skill mismatch" in response.json()["detail"]
+
+def test_update_project_below_allocated_hours():
+    _, proj_id = create_allocated_pair()
+    response = client.put(f"/update_project/{proj_id}", json={
+        "project_name": "Analytics",
+        "project_duration": 20,
+        "project_skill_required": "Python"
+    })
+    assert response.status_code == 400
+    assert "40 hours allocated" in response.json()["detail"]
+
+    response = client.put(f"/update_project/{proj_id}", json={
+        "project_name": "Analytics",
+        "project_duration": 40,
+        "project_skill_required": "python"
+    })
+    assert response.status_code == 200
+
+def test_audit():
+    response = client.get("/audit")
+    assert response.status_code == 200
+    assert response.json() == {
+        "over_capacity_employees": [],
+        "over_capacity_projects": [],
+        "skill_mismatches": []
+    }
+
+    emp_id, proj_id = create_allocated_pair()
+    from database import sessionlocal
+    from models import EmployeeDB, ProjectDB
+    db = sessionlocal()
+    db.get(EmployeeDB, emp_id).available_hrs = 10
+    db.get(ProjectDB, proj_id).project_skill_required = "Rust"
+    db.commit()
+    db.close()
+
+    data = client.get("/audit").json()
+    assert [emp["employee_id"] for emp in data["over_capacity_employees"]] == [emp_id]
+    assert data["over_capacity_employees"][0]["allocated_hours"] == 40
+    assert data["over_capacity_projects"] == []
+    assert [mismatch["project_id"] for mismatch in data["skill_mismatches"]] == [proj_id]
+
+def test_read_allocations_at():
+    emp_id, proj_id = create_allocated_pair()
+    allocation_id = client.get("/read_allocations").json()[0]["allocation_id"]
+    before_update = datetime.now(timezone.utc)
+
+    client.put(f"/update_allocation/{allocation_id}", json={
+        "employee_id": emp_id,
+        "project_id": proj_id,
+        "allocation_hours": 25
+    })
+    before_delete = datetime.now(timezone.utc)
+    client.delete(f"/delete_allocation/{allocation_id}")
+    after_delete = datetime.now(timezone.utc)
+
+    response = client.get("/read_allocations_at", params={"at": before_update.isoformat(), "project_id": proj_id})
+    assert response.status_code == 200
+    assert [alloc["allocation_hours"] for alloc in response.json()] == [40]
+
+    response = client.get("/read_allocations_at", params={"at": before_delete.isoformat(), "employee_id": emp_id})
+    assert [alloc["allocation_hours"] for alloc in response.json()] == [25]
+
+    response = client.get("/read_allocations_at", params={"at": after_delete.isoformat()})
+    assert response.json() == []
+
+def test_allocation_snapshot():
+    emp_id, proj_id = create_allocated_pair()
+    before_snapshot = datetime.now(timezone.utc)
+
+    response = client.post("/create_allocation_snapshot")
+    assert response.status_code == 201
+    assert response.json()["allocation_count"] == 1
+
+    after_snapshot = datetime.now(timezone.utc)
+    for at in (before_snapshot, after_snapshot):
+        response = client.get("/read_allocations_at", params={"at": at.isoformat()})
+        allocations = response.json()
+        assert len(allocations) == 1
+        assert allocations[0]["employee_id"] == emp_id
+        assert allocations[0]["project_id"] == proj_id
+
+def test_bootstrap():
+    emp_id, proj_id = create_allocated_pair()
+    response = client.get("/bootstrap")
+    assert response.status_code == 200
+    data = response.json()
+    assert [emp["employee_id"] for emp in data["employees"]] == [emp_id]
+    assert [proj["project_id"] for proj in data["projects"]] == [proj_id]
+    assert len(data["allocations"]) == 1
+    assert data["allocations"][0]["total_employee_hours"] == 40
+    assert data["allocations"][0]["remaining_hours"] == 60
+
+def test_responses_are_gzipped():
+    for i in range(20):
+        client.post("/create_employee", json={
+            "employee_name": f"Employee {i}",
+            "skilled_language": "Python",
+            "available_hrs": 40
+        })
+    response = client.get("/bootstrap", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["employees"]) == 20
+
+def test_frontend_assets_are_hashed_and_cached():
+    response = client.get("/app/")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-cache"
+    html = response.text
+    assert 'src="app.js"' not in html
+
+    script = html.split('<script src="')[1].split('"')[0]
+    asset_response = client.get(f"/app/{script}")
+    assert asset_response.status_code == 200
+    assert "immutable" in asset_response.headers["cache-control"]
+    assert "loadBootstrap" in asset_response.text
+
+    assert client.get("/app/app.js").status_code == 404
+
+def test_skill_match_is_unicode_case_insensitive():
+    emp_id = client.post("/create_employee", json={
+        "employee_name": "Mia",
+        "skilled_language": "Ärzte-App",
+        "available_hrs": 40
+    }).json()["employee_id"]
+    proj_id = client.post("/create_project", json={
+        "project_name": "Clinic",
+        "project_duration": 80,
+        "project_skill_required": "ärzte-app"
+    }).json()["project_id"]
+
+    response = client.post("/create_allocation", json={
+        "employee_id": emp_id,
+        "project_id": proj_id,
+        "allocation_hours": 10
+    })
+    assert response.status_code == 201
+
+    assert client.get("/audit").json()["skill_mismatches"] == []
+    assert client.get("/read_allocations_detailed").json()[0]["skills_match"] is True
+
+    response = client.put(f"/update_project/{proj_id}", json={
+        "project_name": "Clinic",
+        "project_duration": 80,
+        "project_skill_required": "ÄRZTE-APP"
+    })
+    assert response.status_code == 200
+
+def test_history_seeded_for_existing_allocations():
+    emp_id, proj_id = create_allocated_pair()
+    from main import create_tables
+    from models import AllocationHistoryDB, AllocationSnapshotDB
+    AllocationHistoryDB.__table__.drop(bind=engine)
+    AllocationSnapshotDB.__table__.drop(bind=engine)
+
+    create_tables()
+
+    response = client.get("/read_allocations_at", params={"at": datetime.now(timezone.utc).isoformat()})
+    allocations = response.json()
+    assert len(allocations) == 1
+    assert allocations[0]["employee_id"] == emp_id
+    assert allocations[0]["project_id"] == proj_id
+
+def test_concurrent_writes_do_not_lock():
+    def create_employees(worker):
+        worker_client = TestClient(app)
+        statuses = []
+        for i in range(25):
+            response = worker_client.post("/create_employee", json={
+                "employee_name": f"Worker {worker} Employee {i}",
+                "skilled_language": "Python",
+                "available_hrs": 40
+            })
+            statuses.append(response.status_code)
+            statuses.append(worker_client.get("/bootstrap").status_code)
+        return statuses
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(create_employees, range(16)))
+
+    assert all(status in (200, 201) for statuses in results for status in statuses)
+    assert len(client.get("/read_employees").json()) == 400
+
+def test_allocation_indexes_created_on_existing_database():
+    from main import create_tables
+    from models import AllocationDB
+    from sqlalchemy import inspect
+    for index in AllocationDB.__table__.indexes:
+        index.drop(bind=engine)
+    assert inspect(engine).get_indexes("allocationdb") == []
+
+    create_tables()
+
+    names = {index["name"] for index in inspect(engine).get_indexes("allocationdb")}
+    assert names == {index.name for index in AllocationDB.__table__.indexes}
+
+def test_skill_key_added_to_existing_database():
+    client.post("/create_employee", json={
+        "employee_name": "Nora",
+        "skilled_language": "Ärzte-App",
+        "available_hrs": 40
+    })
+    from main import create_tables
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ALTER TABLE employeedb DROP COLUMN skill_key")
+
+    create_tables()
+
+    with engine.connect() as conn:
+        keys = conn.exec_driver_sql("SELECT skill_key FROM employeedb").scalars().all()
+    assert keys == ["ärzte-app"]
+
+def test_history_timestamp_taken_under_write_lock():
+    import sqlite3
+    from main import history_timestamp
+    from database import sessionlocal
+    db = sessionlocal()
+    try:
+        history_timestamp(db)
+        other = sqlite3.connect(engine.url.database, timeout=0)
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            other.execute("INSERT INTO allocationsnapshotdb (taken_at, allocation_count) VALUES ('2020-01-01', 0)")
+        other.close()
+    finally:
+        db.rollback()
+        db.close()
+
+def test_write_during_slow_bootstrap():
+    import threading
+    import time
+    import main
+    create_allocated_pair()
+    original = main.allocation_details
+    write = {}
+
+    def create_employee():
+        start = time.monotonic()
+        response = TestClient(app).post("/create_employee", json={
+            "employee_name": "Olivia",
+            "skilled_language": "Go",
+            "available_hrs": 40
+        })
+        write["status"] = response.status_code
+        write["seconds"] = time.monotonic() - start
+
+    def slow_allocation_details(db):
+        writer = threading.Thread(target=create_employee)
+        writer.start()
+        writer.join(timeout=10)
+        return original(db)
+
+    main.allocation_details = slow_allocation_details
+    try:
+        response = client.get("/bootstrap")
+    finally:
+        main.allocation_details = original
+
+    assert response.status_code == 200
+    assert write["status"] == 201
+    assert write["seconds"] < 2
+    assert [emp["employee_name"] for emp in response.json()["employees"]] == ["Karl"]
+    assert len(client.get("/read_employees").json()) == 2